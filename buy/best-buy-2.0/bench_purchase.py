@@ -0,0 +1,93 @@
+"""
+Microbenchmark for per-purchase latency on small quantities.
+Compares the purchase logic before the price tables (promotion formula on
+every call) with the current Product.purchase.
+
+Run with: python bench_purchase.py
+"""
+import timeit
+
+import products
+import promotions
+
+ROUNDS = 200_000
+
+
+def _make_products():
+    """
+    Builds one product per promotion type.
+
+    Returns:
+        list: Product objects with a promotion set.
+    """
+    promotion_list = [
+        promotions.PercentDiscount("30% off", percent=30),
+        promotions.SecondHalfPrice("Second Half Price"),
+        promotions.ThirdOneFree("Third One Free"),
+    ]
+    product_list = []
+    for promotion in promotion_list:
+        product = products.Product(promotion.name, price=250, quantity=10 ** 9)
+        product.set_promotion(promotion)
+        product_list.append(product)
+    return product_list
+
+
+def _formula_purchase(product, amount):
+    """
+    Purchase logic before the price tables: the same checks and stock update
+    as Product.purchase, but always pricing with the promotion formula.
+
+    Args:
+        product (Product): The product instance.
+        amount (int): Quantity to purchase.
+
+    Returns:
+        float: Total price after promotion (if applicable).
+    """
+    if not product.active:
+        raise ValueError(f"Product '{product.name}' is not active.")
+    if amount > product.quantity:
+        raise ValueError(f"Not enough stock for '{product.name}'.")
+
+    promotion = product.get_promotion()
+    if promotion:
+        total_price = promotion.apply_promotion(product, amount)
+    else:
+        total_price = product.price * amount
+
+    product.quantity -= amount
+    if product.quantity == 0:
+        product.deactivate()
+
+    return total_price
+
+
+def _bench(label, func, purchases_per_call):
+    """
+    Times func over ROUNDS calls and prints the latency per purchase.
+
+    Args:
+        label (str): Name shown in the output.
+        func (callable): Function taking no arguments.
+        purchases_per_call (int): Number of purchases priced by one func call.
+    """
+    seconds = min(timeit.repeat(func, number=ROUNDS, repeat=5))
+    print(f"{label:<40} {seconds / (ROUNDS * purchases_per_call) * 1e9:8.1f} ns/purchase")
+
+
+def main():
+    """
+    Runs the benchmark for each promotion type.
+    """
+    for product in _make_products():
+        amounts = range(1, products.SMALL_QUANTITY_LIMIT + 1)
+        print(f"\n{product.get_promotion().name}")
+        _bench("  before: purchase with formula",
+               lambda: [_formula_purchase(product, amount) for amount in amounts], len(amounts))
+        _bench("  after: purchase() with table",
+               lambda: [product.purchase(amount) for amount in amounts], len(amounts))
+
+
+if __name__ == "__main__":
+    main()
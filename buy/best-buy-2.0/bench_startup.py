@@ -0,0 +1,106 @@
+"""
+Startup benchmark for the CLI.
+
+Measures time-to-first-prompt (process launch until the menu prompt is
+printed) for the lazy CLI and for the eager baseline, which loads the
+catalog before the menu like main.py used to, and the import time of the
+store modules via `python -X importtime`.
+
+Run with: python bench_startup.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROMPT = b"Please choose a number: "
+MODULES = ("main", "products", "promotions", "store", "storage")
+# Both modes start the CLI the same way, so only the catalog loading differs.
+MODES = {
+    "eager (baseline)": "import main; main.start(lazy=False)",
+    "lazy": "import main; main.start()",
+}
+
+
+def time_to_first_prompt(code):
+    """
+    Launches the CLI and waits for the first menu prompt.
+
+    Args:
+        code (str): Python source passed to -c to start the CLI.
+
+    Returns:
+        tuple: (wall-clock ms from launch, launch_to_first_prompt_ms and
+        main_to_first_prompt_ms reported by main.py)
+
+    Raises:
+        RuntimeError: If main.py exits early or does not report its metrics.
+    """
+    env = dict(os.environ, BEST_BUY_STARTUP_METRICS="1", BEST_BUY_LAUNCH_TIME=repr(time.time()))
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-c", code], cwd=HERE, env=env,
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    output = b""
+    while not output.endswith(PROMPT):
+        chunk = process.stdout.read1(4096)
+        if not chunk:
+            raise RuntimeError("main.py exited before showing the prompt.")
+        output += chunk
+    wall_ms = (time.perf_counter() - start) * 1000
+    _, stderr = process.communicate(b"4\n")
+    metrics = {}
+    for line in stderr.decode().splitlines():
+        name, _, value = line.partition("=")
+        if name in ("launch_to_first_prompt_ms", "main_to_first_prompt_ms"):
+            metrics[name] = float(value)
+    if len(metrics) != 2:
+        raise RuntimeError(f"main.py did not report its startup metrics, stderr was: {stderr.decode()!r}")
+    return wall_ms, metrics["launch_to_first_prompt_ms"], metrics["main_to_first_prompt_ms"]
+
+
+def import_times(code):
+    """
+    Runs `python -X importtime -c code` and collects the store modules.
+
+    Args:
+        code (str): Python source passed to -c.
+
+    Returns:
+        dict: Cumulative import time in microseconds per store module.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=HERE,
+                            capture_output=True)
+    times = {}
+    for line in result.stderr.decode().splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if name in MODULES:
+            times[name] = int(cumulative)
+    return times
+
+
+def main():
+    """
+    Runs the startup benchmark and prints the results.
+    """
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"time-to-first-prompt over {runs} runs (medians)")
+    for label, code in MODES.items():
+        results = [time_to_first_prompt(code) for _ in range(runs)]
+        print(f"\n{label}")
+        print(f"  wall clock (launch to prompt): {statistics.median(r[0] for r in results):7.1f} ms")
+        print(f"  launch_to_first_prompt_ms:     {statistics.median(r[1] for r in results):7.1f} ms")
+        print(f"  main_to_first_prompt_ms:       {statistics.median(r[2] for r in results):7.3f} ms")
+
+    for label, code in (("startup path", "import main"),
+                        ("catalog (deferred)", "import main; main.load_store()")):
+        print(f"\nimport time, {label} (python -X importtime, cumulative)")
+        for name, micros in sorted(import_times(code).items()):
+            print(f"  {name:<12} {micros:8d} us")
+
+
+if __name__ == "__main__":
+    main()
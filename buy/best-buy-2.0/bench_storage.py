@@ -0,0 +1,80 @@
+"""
+Benchmark comparing the list and SQLite storage backends for lookups,
+orders and totals.
+
+Run with: python bench_storage.py [catalog_size]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import products
+import sqlite_storage
+import storage
+
+ROUNDS = 1000
+
+
+def _make_catalog(size):
+    """
+    Builds a catalog of stocked products.
+
+    Args:
+        size (int): Number of products.
+
+    Returns:
+        list: Product objects.
+    """
+    return [products.Product(f"Product {i}", price=10 + i % 90, quantity=10 ** 6) for i in range(size)]
+
+
+def _bench(label, func):
+    """
+    Times func over ROUNDS calls and prints the latency per call.
+
+    Args:
+        label (str): Name shown in the output.
+        func (callable): Function taking the round number.
+    """
+    start = time.perf_counter()
+    for i in range(ROUNDS):
+        func(i)
+    seconds = time.perf_counter() - start
+    print(f"{label:<30} {seconds / ROUNDS * 1e6:10.1f} us/op")
+
+
+def _run(label, backend, size):
+    """
+    Runs the lookup, order and total benchmarks against one backend.
+
+    Args:
+        label (str): Backend name shown in the output.
+        backend (StorageBackend): Storage with the catalog loaded.
+        size (int): Number of products in the catalog.
+    """
+    print(f"\n{label}")
+    _bench("  lookup (get_product)", lambda i: backend.get_product(f"Product {i * 7 % size}"))
+    _bench("  order (3 items)", lambda i: backend.order(
+        [(backend.get_product(f"Product {(i + k) % size}"), 1) for k in range(3)]))
+    _bench("  total (get_total_quantity)", lambda i: backend.get_total_quantity())
+
+
+def main():
+    """
+    Runs the benchmark for both backends.
+    """
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    print(f"Catalog size: {size}")
+    _run("ListStorage", storage.ListStorage(_make_catalog(size)), size)
+
+    with tempfile.TemporaryDirectory() as directory:
+        backend = sqlite_storage.SQLiteStorage(os.path.join(directory, "bench.db"))
+        for product in _make_catalog(size):
+            backend.add_product(product)
+        _run("SQLiteStorage", backend, size)
+        backend.close()
+
+
+if __name__ == "__main__":
+    main()
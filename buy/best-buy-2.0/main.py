@@ -1,6 +1,115 @@
-import products
-import store
-import promotions
+import os
+import sys
+import time
+
+# Taken once main.py's own imports are done; interpreter startup is not included.
+_MAIN_START_TIME = time.perf_counter()
+
+
+class CatalogLoader:
+    """
+    Builds the store in a background thread so the menu can be shown
+    before the catalog and promotions are loaded. Without prefetch the store
+    is built on first use, in the calling thread.
+    """
+
+    def __init__(self, factory):
+        """
+        Initializes the loader.
+
+        Args:
+            factory (callable): Function returning the Store instance.
+        """
+        self._factory = factory
+        self._store = None
+        self._error = None
+        self._loaded = False
+        self._thread = None
+
+    def _load(self):
+        """Runs the factory and keeps its result or error."""
+        try:
+            self._store = self._factory()
+        except Exception as error:
+            self._error = error
+        self._loaded = True
+
+    def prefetch(self):
+        """Starts loading the catalog in the background, unless already started."""
+        # Imported here, as threading is not needed before the first prompt.
+        import threading
+
+        if self._thread is None and not self._loaded:
+            self._thread = threading.Thread(target=self._load, daemon=True)
+            self._thread.start()
+
+    def get(self):
+        """
+        Returns the store, waiting for the background load if needed.
+
+        Returns:
+            Store: The loaded store.
+        """
+        if self._thread is not None:
+            self._thread.join()
+        elif not self._loaded:
+            self._load()
+        if self._error:
+            raise self._error
+        return self._store
+
+
+def load_store():
+    """
+    Imports the store modules and sets up the initial products and promotions.
+
+    Returns:
+        Store: The store instance.
+    """
+    import products
+    import promotions
+    import store
+
+    # Setup initial products with various types
+    product_list = [
+        products.Product("MacBook Air M2", price=1450, quantity=100),
+        products.Product("Bose QuietComfort Earbuds", price=250, quantity=500),
+        products.Product("Google Pixel 7", price=500, quantity=250),
+        products.NonStockedProduct("Windows License", price=125),
+        products.LimitedProduct("Shipping", price=10, quantity=250, maximum=1)
+    ]
+
+    # Create promotion instances
+    second_half_price = promotions.SecondHalfPrice("Second Half Price")
+    third_one_free = promotions.ThirdOneFree("Third One Free")
+    thirty_percent = promotions.PercentDiscount("30% off", percent=30)
+
+    # Assign promotions to products
+    product_list[0].set_promotion(second_half_price)
+    product_list[1].set_promotion(third_one_free)
+    product_list[3].set_promotion(thirty_percent)
+
+    return store.Store(product_list)
+
+
+def report_time_to_first_prompt():
+    """
+    Writes startup metrics to stderr when the BEST_BUY_STARTUP_METRICS
+    environment variable is set:
+
+    - main_to_first_prompt_ms: from the end of main.py's imports to the prompt.
+    - launch_to_first_prompt_ms: from the time.time() timestamp in
+      BEST_BUY_LAUNCH_TIME (set by the launcher) to the prompt, only if given.
+    """
+    if not os.environ.get("BEST_BUY_STARTUP_METRICS"):
+        return
+    elapsed = time.perf_counter() - _MAIN_START_TIME
+    print(f"main_to_first_prompt_ms={elapsed * 1000:.3f}", file=sys.stderr)
+    launch_time = os.environ.get("BEST_BUY_LAUNCH_TIME")
+    if launch_time:
+        elapsed = time.time() - float(launch_time)
+        print(f"launch_to_first_prompt_ms={elapsed * 1000:.3f}", file=sys.stderr)
+
 
 def show_menu():
     """
@@ -85,35 +194,38 @@ def make_order(best_buy):
             print(f"Error: {error}")
 
 
-def start():
+def start(lazy=True):
     """
     Starts the user interface for the store.
-    Sets up initial products, promotions and runs the main menu loop.
-    """
-    # Setup initial products with various types
-    product_list = [
-        products.Product("MacBook Air M2", price=1450, quantity=100),
-        products.Product("Bose QuietComfort Earbuds", price=250, quantity=500),
-        products.Product("Google Pixel 7", price=500, quantity=250),
-        products.NonStockedProduct("Windows License", price=125),
-        products.LimitedProduct("Shipping", price=10, quantity=250, maximum=1)
-    ]
-
-    # Create promotion instances
-    second_half_price = promotions.SecondHalfPrice("Second Half Price")
-    third_one_free = promotions.ThirdOneFree("Third One Free")
-    thirty_percent = promotions.PercentDiscount("30% off", percent=30)
-
-    # Assign promotions to products
-    product_list[0].set_promotion(second_half_price)
-    product_list[1].set_promotion(third_one_free)
-    product_list[3].set_promotion(thirty_percent)
+    Shows the menu and the first prompt right away, then loads the catalog
+    in the background while waiting for input, and runs the main menu loop.
 
-    best_buy = store.Store(product_list)
+    Args:
+        lazy (bool): If False, load the catalog before showing the menu
+            (used as the baseline in bench_startup.py).
+    """
+    catalog = CatalogLoader(load_store)
+    if not lazy:
+        catalog.get()
 
+    first_prompt = True
     while True:
         show_menu()
-        choice = input("Please choose a number: ")
+        if first_prompt:
+            print("Please choose a number: ", end="", flush=True)
+            report_time_to_first_prompt()
+            catalog.prefetch()
+            choice = input()
+            first_prompt = False
+        else:
+            choice = input("Please choose a number: ")
+
+        if choice in ("1", "2", "3"):
+            try:
+                best_buy = catalog.get()
+            except Exception as error:
+                print(f"Error: Could not load the store: {error}")
+                sys.exit(1)
 
         if choice == "1":
             list_products(best_buy)
@@ -1,3 +1,7 @@
+# Purchases of up to this many units are priced from a precomputed table.
+SMALL_QUANTITY_LIMIT = 10
+
+
 class Product:
     """
     Represents a basic product in the store with price, quantity, and optional promotion.
@@ -15,10 +19,62 @@ class Product:
         if price < 0 or quantity < 0:
             raise ValueError("Price and quantity must be non-negative.")
         self.name = name
+        self._promotion = None
         self.price = price
         self.quantity = quantity
         self.active = True
-        self._promotion = None
+
+    @property
+    def price(self):
+        """
+        Returns the price per unit.
+
+        Returns:
+            float: Price per unit.
+        """
+        return self._price
+
+    @price.setter
+    def price(self, value):
+        """
+        Sets the price per unit; the small-quantity price table is rebuilt
+        on next use.
+
+        Args:
+            value (float): New price per unit.
+        """
+        self._price = value
+        self._price_table = None
+
+    def _build_price_table(self):
+        """
+        Precomputes the total price for quantities 0..SMALL_QUANTITY_LIMIT,
+        so small purchases do not re-run the promotion formula.
+        """
+        if self._promotion:
+            self._price_table = self._promotion.build_price_table(self, SMALL_QUANTITY_LIMIT)
+        else:
+            self._price_table = [self._price * amount for amount in range(SMALL_QUANTITY_LIMIT + 1)]
+
+    def get_total_price(self, amount):
+        """
+        Calculates the total price for a given amount, applying promotion if any.
+        Small int amounts are looked up in the precomputed table; anything
+        else goes through the promotion formula.
+
+        Args:
+            amount (int): Quantity to price.
+
+        Returns:
+            float: Total price after promotion (if applicable).
+        """
+        if type(amount) is int and 0 <= amount <= SMALL_QUANTITY_LIMIT:
+            if self._price_table is None:
+                self._build_price_table()
+            return self._price_table[amount]
+        if self._promotion:
+            return self._promotion.apply_promotion(self, amount)
+        return self._price * amount
 
     def is_active(self):
         """
@@ -45,6 +101,7 @@ class Product:
             promotion (Promotion): A promotion object.
         """
         self._promotion = promotion
+        self._price_table = None
 
     def get_promotion(self):
         """
@@ -80,10 +137,7 @@ class Product:
         if amount > self.quantity:
             raise ValueError(f"Not enough stock for '{self.name}'.")
 
-        if self._promotion:
-            total_price = self._promotion.apply_promotion(self, amount)
-        else:
-            total_price = self.price * amount
+        total_price = self.get_total_price(amount)
 
         self.quantity -= amount
         if self.quantity == 0:
@@ -129,9 +183,7 @@ class NonStockedProduct(Product):
         """
         if not self.active:
             raise ValueError(f"Product '{self.name}' is not active.")
-        if self._promotion:
-            return self._promotion.apply_promotion(self, amount)
-        return self.price * amount
+        return self.get_total_price(amount)
 
 
 class LimitedProduct(Product):
@@ -179,10 +231,7 @@ class LimitedProduct(Product):
         if amount > self.quantity:
             raise ValueError(f"Not enough stock for '{self.name}'.")
 
-        if self._promotion:
-            total_price = self._promotion.apply_promotion(self, amount)
-        else:
-            total_price = self.price * amount
+        total_price = self.get_total_price(amount)
 
         self.quantity -= amount
         if self.quantity == 0:
@@ -31,6 +31,19 @@ class Promotion(ABC):
         """
         pass
 
+    def build_price_table(self, product, max_quantity):
+        """
+        Precomputes the promotion price for every quantity up to max_quantity.
+
+        Args:
+            product (Product): The product instance.
+            max_quantity (int): Largest quantity to include in the table.
+
+        Returns:
+            list: Total price indexed by quantity (0..max_quantity).
+        """
+        return [self.apply_promotion(product, quantity) for quantity in range(max_quantity + 1)]
+
 
 class PercentDiscount(Promotion):
     """
@@ -51,7 +64,18 @@ class PercentDiscount(Promotion):
         super().__init__(name)
         if not (0 <= percent <= 100):
             raise ValueError("Percent must be between 0 and 100.")
-        self.percent = percent
+        self._percent = percent
+
+    @property
+    def percent(self):
+        """
+        Returns the discount percentage. It is read-only, since products
+        precompute their prices from it when the promotion is set.
+
+        Returns:
+            float: Discount percentage.
+        """
+        return self._percent
 
     def apply_promotion(self, product, quantity):
         """
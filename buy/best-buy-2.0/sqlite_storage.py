@@ -0,0 +1,307 @@
+import queue
+import sqlite3
+from contextlib import contextmanager
+
+import products
+import promotions
+from storage import StorageBackend
+
+# Promotion classes that can be stored, keyed by their name in the promo_kind column.
+PROMOTION_KINDS = {
+    "percent_discount": promotions.PercentDiscount,
+    "second_half_price": promotions.SecondHalfPrice,
+    "third_one_free": promotions.ThirdOneFree,
+}
+
+
+class SQLiteStorage(StorageBackend):
+    """
+    Keeps products in a SQLite database file, so the catalog does not have to
+    fit in memory and stock can be shared between processes on one host.
+
+    Connections are pooled and opened in WAL mode. Stock is decremented in SQL
+    with a guarded UPDATE, so concurrent orders can never oversell.
+    Products are read as snapshots: changes to a product object are only
+    stored by passing it to update_product.
+    """
+
+    _CREATE_TABLE = (
+        "CREATE TABLE IF NOT EXISTS products ("
+        "name TEXT PRIMARY KEY, kind TEXT NOT NULL, price NUMERIC NOT NULL, "
+        "quantity INTEGER NOT NULL, maximum INTEGER, active INTEGER NOT NULL, "
+        "promo_kind TEXT, promo_name TEXT, promo_percent NUMERIC)"
+    )
+    _COLUMNS = "name, kind, price, quantity, maximum, active, promo_kind, promo_name, promo_percent"
+    _INSERT = f"INSERT INTO products ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    _UPDATE = (
+        "UPDATE products SET price = ?, maximum = ?, active = ?, "
+        "promo_kind = ?, promo_name = ?, promo_percent = ? WHERE name = ?"
+    )
+    _DELETE = "DELETE FROM products WHERE name = ?"
+    _SELECT_ALL = f"SELECT {_COLUMNS} FROM products ORDER BY rowid"
+    _SELECT_ONE = f"SELECT {_COLUMNS} FROM products WHERE name = ?"
+    _SELECT_STOCK = "SELECT quantity, active FROM products WHERE name = ?"
+    _TOTAL = "SELECT COALESCE(SUM(quantity), 0) FROM products"
+    _DECREMENT = (
+        "UPDATE products SET quantity = quantity - ?, active = (quantity - ? > 0) "
+        "WHERE name = ? AND active = 1 AND quantity >= ?"
+    )
+
+    def __init__(self, path, pool_size=4):
+        """
+        Opens the database and creates the products table if needed.
+
+        Args:
+            path (str): Path to the database file (not ":memory:", as every
+                pooled connection would get its own database).
+            pool_size (int): Number of pooled connections.
+        """
+        if path == ":memory:":
+            raise ValueError("SQLiteStorage needs a database file path.")
+        self.path = path
+        self._closed = False
+        self._pool = queue.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self._pool.put(self._connect())
+        with self._connection() as conn, conn:
+            conn.execute(self._CREATE_TABLE)
+
+    def _connect(self):
+        """
+        Opens a new connection in WAL mode.
+
+        Returns:
+            sqlite3.Connection: The connection.
+        """
+        conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def _connection(self):
+        """
+        Borrows a connection from the pool and returns it afterwards.
+
+        Yields:
+            sqlite3.Connection: A pooled connection.
+
+        Raises:
+            ValueError: If the storage has been closed.
+        """
+        if self._closed:
+            raise ValueError("SQLiteStorage is closed.")
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def close(self):
+        """Closes all pooled connections. The storage cannot be used afterwards."""
+        self._closed = True
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+    def _promotion_columns(self, product):
+        """
+        Converts the promotion of a product into promo_kind, promo_name and
+        promo_percent values.
+
+        Args:
+            product (Product): The product.
+
+        Returns:
+            tuple: Values for the promotion columns.
+
+        Raises:
+            ValueError: If the promotion type cannot be stored.
+        """
+        promotion = product.get_promotion()
+        if promotion is None:
+            return None, None, None
+        for kind, promotion_class in PROMOTION_KINDS.items():
+            if type(promotion) is promotion_class:
+                return kind, promotion.name, getattr(promotion, "percent", None)
+        raise ValueError(f"Promotion '{promotion.name}' of '{product.name}' cannot be stored.")
+
+    def _to_row(self, product):
+        """
+        Converts a product into a table row.
+
+        Args:
+            product (Product): The product.
+
+        Returns:
+            tuple: Values for the products table.
+        """
+        if isinstance(product, products.NonStockedProduct):
+            kind, maximum = "non_stocked", None
+        elif isinstance(product, products.LimitedProduct):
+            kind, maximum = "limited", product.maximum
+        else:
+            kind, maximum = "product", None
+        return (product.name, kind, product.price, product.quantity, maximum, int(product.active),
+                *self._promotion_columns(product))
+
+    def _from_row(self, row):
+        """
+        Builds a product, with its promotion, from a table row.
+
+        Args:
+            row (tuple): Values from the products table.
+
+        Returns:
+            Product: The product.
+        """
+        name, kind, price, quantity, maximum, active, promo_kind, promo_name, promo_percent = row
+        if kind == "non_stocked":
+            product = products.NonStockedProduct(name, price)
+        elif kind == "limited":
+            product = products.LimitedProduct(name, price, quantity, maximum)
+        else:
+            product = products.Product(name, price, quantity)
+        if not active:
+            product.deactivate()
+        if promo_kind == "percent_discount":
+            product.set_promotion(promotions.PercentDiscount(promo_name, percent=promo_percent))
+        elif promo_kind:
+            product.set_promotion(PROMOTION_KINDS[promo_kind](promo_name))
+        return product
+
+    def get_all_products(self):
+        """
+        Returns snapshots of all products, read fresh from the database.
+
+        Returns:
+            list: Product objects.
+        """
+        return list(self.iter_products())
+
+    def iter_products(self):
+        """
+        Iterates over snapshots of all products, reading rows from the cursor
+        one at a time. A pooled connection is held until iteration finishes.
+
+        Yields:
+            Product: The next product.
+        """
+        with self._connection() as conn:
+            for row in conn.execute(self._SELECT_ALL):
+                yield self._from_row(row)
+
+    def get_product(self, name):
+        """
+        Looks up a snapshot of a product by name.
+
+        Args:
+            name (str): Product name.
+
+        Returns:
+            Product or None: The product, or None if not found.
+        """
+        with self._connection() as conn:
+            row = conn.execute(self._SELECT_ONE, (name,)).fetchone()
+        return self._from_row(row) if row else None
+
+    def get_total_quantity(self):
+        """
+        Calculates the total quantity of all products in SQL.
+
+        Returns:
+            int: Total number of items in stock across all products.
+        """
+        with self._connection() as conn:
+            return conn.execute(self._TOTAL).fetchone()[0]
+
+    def add_product(self, product):
+        """
+        Inserts a new product.
+
+        Args:
+            product (Product): The product to be added.
+
+        Raises:
+            ValueError: If a product with the same name is already stored,
+                or its promotion cannot be stored.
+        """
+        row = self._to_row(product)
+        try:
+            with self._connection() as conn, conn:
+                conn.execute(self._INSERT, row)
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Product '{product.name}' is already in store.")
+
+    def update_product(self, product):
+        """
+        Saves the price, maximum, active state and promotion of a product.
+        Stock is left alone, as it is only changed by orders.
+
+        Args:
+            product (Product): The changed product.
+
+        Raises:
+            ValueError: If the product is not stored, or its promotion cannot be stored.
+        """
+        name, _, price, _, maximum, active, *promotion_columns = self._to_row(product)
+        with self._connection() as conn, conn:
+            cursor = conn.execute(self._UPDATE, (price, maximum, active, *promotion_columns, name))
+        if cursor.rowcount == 0:
+            raise ValueError(f"Product '{product.name}' is not in store.")
+
+    def remove_product(self, product):
+        """
+        Deletes a product.
+
+        Args:
+            product (Product): The product to be removed.
+        """
+        with self._connection() as conn, conn:
+            conn.execute(self._DELETE, (product.name,))
+
+    def order(self, shopping_list):
+        """
+        Processes an order in a single write transaction. Each item is checked
+        and priced against its stored row, not the given product object, so
+        every process charges the current price. All stock decrements are
+        written as one batch; if any item is missing, inactive or out of stock
+        the whole order is rolled back. Afterwards the given product objects
+        are refreshed with their stored quantity and active state.
+
+        Args:
+            shopping_list (list): A list of tuples (Product, quantity).
+
+        Returns:
+            float: The total cost of all purchased items.
+
+        Raises:
+            ValueError: If a product is not in store, does not have enough
+                quantity in stock or purchase invalid.
+        """
+        total_price = 0
+        decrements = []
+        with self._connection() as conn, conn:
+            conn.execute("BEGIN IMMEDIATE")
+            for product, quantity in shopping_list:
+                row = conn.execute(self._SELECT_ONE, (product.name,)).fetchone()
+                if row is None:
+                    raise ValueError(f"Product '{product.name}' is not in store.")
+                stored = self._from_row(row)
+                if not stored.is_active():
+                    raise ValueError(f"Product '{stored.name}' is not active.")
+                if isinstance(stored, products.LimitedProduct) and quantity > stored.maximum:
+                    raise ValueError(f"Cannot purchase more than {stored.maximum} of '{stored.name}'.")
+                if not isinstance(stored, products.NonStockedProduct):
+                    decrements.append((quantity, quantity, stored.name, quantity))
+                total_price += stored.get_total_price(quantity)
+
+            changes_before = conn.total_changes
+            conn.executemany(self._DECREMENT, decrements)
+            if conn.total_changes - changes_before != len(decrements):
+                raise ValueError("Not enough stock for one or more products in the order.")
+
+            for product, _ in shopping_list:
+                quantity, active = conn.execute(self._SELECT_STOCK, (product.name,)).fetchone()
+                product.quantity = quantity
+                product.active = bool(active)
+        return total_price
@@ -0,0 +1,204 @@
+from abc import ABC, abstractmethod
+
+
+class StorageBackend(ABC):
+    """
+    Abstract base class for the storage behind a Store.
+    """
+
+    @abstractmethod
+    def get_all_products(self):
+        """
+        Returns all products in storage.
+
+        Returns:
+            list: Product objects.
+        """
+        pass
+
+    @abstractmethod
+    def iter_products(self):
+        """
+        Iterates over all products without loading them all at once.
+
+        Returns:
+            iterator: Product objects.
+        """
+        pass
+
+    @abstractmethod
+    def get_product(self, name):
+        """
+        Looks up a product by name.
+
+        Args:
+            name (str): Product name.
+
+        Returns:
+            Product or None: The product, or None if not found.
+        """
+        pass
+
+    @abstractmethod
+    def get_total_quantity(self):
+        """
+        Calculates the total quantity of all products in storage.
+
+        Returns:
+            int: Total number of items in stock.
+        """
+        pass
+
+    @abstractmethod
+    def add_product(self, product):
+        """
+        Adds a product to storage.
+
+        Args:
+            product (Product): The product to be added.
+        """
+        pass
+
+    @abstractmethod
+    def update_product(self, product):
+        """
+        Saves changes made to a product, such as its price, promotion or
+        active state.
+
+        Args:
+            product (Product): The changed product.
+        """
+        pass
+
+    @abstractmethod
+    def remove_product(self, product):
+        """
+        Removes a product from storage.
+
+        Args:
+            product (Product): The product to be removed.
+        """
+        pass
+
+    @abstractmethod
+    def order(self, shopping_list):
+        """
+        Processes an order, reduces stock and returns the total cost.
+
+        Args:
+            shopping_list (list): A list of tuples (Product, quantity).
+
+        Returns:
+            float: The total cost of all purchased items.
+
+        Raises:
+            ValueError: If a product does not have enough quantity in stock or purchase invalid.
+        """
+        pass
+
+
+class ListStorage(StorageBackend):
+    """
+    Keeps products in an in-memory Python list.
+    """
+
+    def __init__(self, product_list=None):
+        """
+        Initializes the storage with a list of products.
+
+        Args:
+            product_list (list): A list of Product objects.
+        """
+        self.products = product_list if product_list is not None else []
+
+    def get_all_products(self):
+        """
+        Returns the list of all products.
+
+        Returns:
+            list: The current list of Product objects.
+        """
+        return self.products
+
+    def iter_products(self):
+        """
+        Iterates over the list of products.
+
+        Returns:
+            iterator: Product objects.
+        """
+        return iter(self.products)
+
+    def get_product(self, name):
+        """
+        Looks up a product by name.
+
+        Args:
+            name (str): Product name.
+
+        Returns:
+            Product or None: The product, or None if not found.
+        """
+        for product in self.products:
+            if product.name == name:
+                return product
+        return None
+
+    def get_total_quantity(self):
+        """
+        Calculates the total quantity of all products.
+
+        Returns:
+            int: Total number of items in stock across all products.
+        """
+        return sum(product.quantity for product in self.products)
+
+    def add_product(self, product):
+        """
+        Adds a new product to the list.
+
+        Args:
+            product (Product): The product to be added.
+        """
+        self.products.append(product)
+
+    def update_product(self, product):
+        """
+        Nothing to save, since the list holds the product objects themselves.
+
+        Args:
+            product (Product): The changed product.
+
+        Raises:
+            ValueError: If the product is not in the list.
+        """
+        if product not in self.products:
+            raise ValueError(f"Product '{product.name}' is not in store.")
+
+    def remove_product(self, product):
+        """
+        Removes a product from the list.
+
+        Args:
+            product (Product): The product to be removed.
+        """
+        self.products.remove(product)
+
+    def order(self, shopping_list):
+        """
+        Purchases each item of the order in turn.
+
+        Args:
+            shopping_list (list): A list of tuples (Product, quantity).
+
+        Returns:
+            float: The total cost of all purchased items.
+
+        Raises:
+            ValueError: If a product does not have enough quantity in stock or purchase invalid.
+        """
+        total_price = 0
+        for product, quantity in shopping_list:
+            total_price += product.purchase(quantity)
+        return total_price
+
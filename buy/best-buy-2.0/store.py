@@ -1,27 +1,64 @@
+from storage import ListStorage
+
+
 class Store:
     """
     A class that represents the store and its operations.
-    Manages a list of Product objects, supports adding/removing products,
-    calculating total inventory, and processing customer orders.
+    Manages Product objects through a storage backend, supports adding/removing
+    products, calculating total inventory, and processing customer orders.
     """
 
-    def __init__(self, product_list):
+    def __init__(self, product_list, backend=None):
         """
         Initializes the store with a list of products.
 
         Args:
             product_list (list): A list of Product objects.
+            backend (StorageBackend): Storage for the products. Defaults to an
+                in-memory ListStorage. Products in product_list whose name is
+                already stored, e.g. when reopening a shared database, are not
+                added: the stored product takes precedence over the seed.
         """
-        self.products = product_list
+        if backend is None:
+            backend = ListStorage(product_list)
+        else:
+            for product in product_list:
+                if backend.get_product(product.name) is None:
+                    backend.add_product(product)
+        self.backend = backend
 
     def get_all_products(self):
         """
         Returns a list of all products in the store.
+        With a SQLiteStorage backend these are snapshots: changes to them are
+        only kept after passing them to update_product.
 
         Returns:
             list: The current list of Product objects in the store.
         """
-        return self.products
+        return self.backend.get_all_products()
+
+    def iter_products(self):
+        """
+        Iterates over all products in the store without loading them all at
+        once, e.g. for catalogs too large for memory.
+
+        Returns:
+            iterator: Product objects.
+        """
+        return self.backend.iter_products()
+
+    def get_product(self, name):
+        """
+        Looks up a product in the store by name.
+
+        Args:
+            name (str): Product name.
+
+        Returns:
+            Product or None: The product, or None if not found.
+        """
+        return self.backend.get_product(name)
 
     def get_total_quantity(self):
         """
@@ -30,7 +67,7 @@ class Store:
         Returns:
             int: Total number of items in stock across all products.
         """
-        return sum(product.quantity for product in self.products)
+        return self.backend.get_total_quantity()
 
     def add_product(self, product):
         """
@@ -39,7 +76,17 @@ class Store:
         Args:
             product (Product): The product to be added.
         """
-        self.products.append(product)
+        self.backend.add_product(product)
+
+    def update_product(self, product):
+        """
+        Saves changes made to a product, such as its price, promotion or
+        active state.
+
+        Args:
+            product (Product): The changed product.
+        """
+        self.backend.update_product(product)
 
     def remove_product(self, product):
         """
@@ -48,7 +95,7 @@ class Store:
         Args:
             product (Product): The product to be removed.
         """
-        self.products.remove(product)
+        self.backend.remove_product(product)
 
     def order(self, shopping_list):
         """
@@ -64,7 +111,4 @@ class Store:
         Raises:
             ValueError: If a product does not have enough quantity in stock or purchase invalid.
         """
-        total_price = 0
-        for product, quantity in shopping_list:
-            total_price += product.purchase(quantity)
-        return total_price
+        return self.backend.order(shopping_list)
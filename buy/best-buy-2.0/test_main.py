@@ -0,0 +1,85 @@
+import pytest
+import main
+from main import CatalogLoader, load_store
+
+
+def test_load_store_builds_catalog():
+    """
+    Tests that load_store sets up the initial products and promotions.
+    """
+    best_buy = load_store()
+    products_list = best_buy.get_all_products()
+    assert len(products_list) == 5
+    assert products_list[0].get_promotion().name == "Second Half Price"
+
+
+def test_catalog_loader_get_without_prefetch():
+    """
+    Tests that get loads the store even if prefetch was not called.
+    """
+    store = object()
+    loader = CatalogLoader(lambda: store)
+    assert loader.get() is store
+
+
+def test_catalog_loader_prefetch_then_get():
+    """
+    Tests that prefetch loads the store once and get returns the same store.
+    """
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return object()
+
+    loader = CatalogLoader(factory)
+    loader.prefetch()
+    store = loader.get()
+    assert loader.get() is store
+    assert len(calls) == 1
+
+
+def test_catalog_loader_reraises_factory_error():
+    """
+    Tests that an error raised while loading is raised again by get.
+    """
+    def factory():
+        raise ValueError("broken catalog")
+
+    loader = CatalogLoader(factory)
+    loader.prefetch()
+    with pytest.raises(ValueError, match="broken catalog"):
+        loader.get()
+
+
+def test_start_exits_cleanly_when_loading_fails(monkeypatch, capsys):
+    """
+    Tests that the CLI prints an error and exits when the store cannot be loaded.
+    """
+    def broken_load_store():
+        raise ValueError("broken catalog")
+
+    monkeypatch.setattr(main, "load_store", broken_load_store)
+    monkeypatch.setattr("builtins.input", lambda prompt="": "1")
+    with pytest.raises(SystemExit) as exit_info:
+        main.start()
+    assert exit_info.value.code == 1
+    assert "Could not load the store: broken catalog" in capsys.readouterr().out
+
+
+def test_catalog_loader_prefetch_after_get_does_not_reload():
+    """
+    Tests that prefetch after the store was loaded on first use does not
+    load it again.
+    """
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return object()
+
+    loader = CatalogLoader(factory)
+    store = loader.get()
+    loader.prefetch()
+    assert loader.get() is store
+    assert len(calls) == 1
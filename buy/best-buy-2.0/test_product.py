@@ -1,5 +1,6 @@
 import pytest
-from products import Product, NonStockedProduct, LimitedProduct
+from products import Product, NonStockedProduct, LimitedProduct, SMALL_QUANTITY_LIMIT
+from promotions import PercentDiscount, SecondHalfPrice, ThirdOneFree
 
 def test_create_normal_product():
     """
@@ -95,3 +96,43 @@ def test_limited_product_show_contains_limit():
     """
     lp = LimitedProduct("Shipping", 10, 100, maximum=1)
     assert "Limited to 1" in lp.show()
+
+@pytest.mark.parametrize("make_product", [
+    lambda: Product("Laptop", 100, 1000),
+    lambda: NonStockedProduct("Windows License", 100),
+    lambda: LimitedProduct("Shipping", 100, 1000, maximum=50),
+])
+@pytest.mark.parametrize("promotion", [
+    None,
+    PercentDiscount("30% off", percent=30),
+    SecondHalfPrice("Second Half Price"),
+    ThirdOneFree("Third One Free"),
+])
+def test_price_table_matches_formula(make_product, promotion):
+    """
+    Test that prices from the precomputed small-quantity table match the
+    formula for every product type, with and without a promotion, around
+    the SMALL_QUANTITY_LIMIT boundary and after a price change.
+    """
+    product = make_product()
+    if promotion:
+        product.set_promotion(promotion)
+
+    def formula(amount):
+        if promotion:
+            return promotion.apply_promotion(product, amount)
+        return product.price * amount
+
+    amounts = range(SMALL_QUANTITY_LIMIT + 3)  # past the table, into the formula
+    assert all(product.get_total_price(amount) == formula(amount) for amount in amounts)
+    product.price = 80
+    assert all(product.get_total_price(amount) == formula(amount) for amount in amounts)
+
+def test_purchase_with_float_amount():
+    """
+    Test that a non-int amount is priced with the formula instead of the
+    precomputed table.
+    """
+    p = Product("Cable", 10, 10)
+    assert p.get_total_price(2.0) == 20.0
+    assert p.get_total_price(2.5) == 25.0
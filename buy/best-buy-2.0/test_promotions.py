@@ -63,3 +63,15 @@ def test_percent_discount_invalid_percent():
     """
     with pytest.raises(ValueError):
         PercentDiscount("Invalid", percent=150)  # Percent must be between 0 and 100
+
+def test_percent_discount_percent_is_read_only():
+    """
+    Test that the discount percentage cannot be changed after creation,
+    so precomputed product price tables cannot go stale.
+    """
+    product = Product("TestProduct", price=100, quantity=100)
+    promo = PercentDiscount("10% off", percent=10)
+    product.set_promotion(promo)
+    with pytest.raises(AttributeError):
+        promo.percent = 50
+    assert product.get_total_price(2) == promo.apply_promotion(product, 2) == 180
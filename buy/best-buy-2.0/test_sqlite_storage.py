@@ -0,0 +1,224 @@
+import pytest
+from store import Store
+from sqlite_storage import SQLiteStorage
+from products import Product, NonStockedProduct, LimitedProduct
+from promotions import SecondHalfPrice, PercentDiscount, Promotion
+
+
+@pytest.fixture
+def sqlite_store(tmp_path):
+    """
+    Fixture that provides a Store backed by SQLite with three products.
+    """
+    macbook = Product("MacBook", 1000, 10)
+    macbook.set_promotion(SecondHalfPrice("Second Half Price"))
+    backend = SQLiteStorage(str(tmp_path / "store.db"))
+    store = Store([macbook, NonStockedProduct("License", 100), LimitedProduct("Shipping", 10, 5, maximum=1)],
+                  backend=backend)
+    yield store
+    backend.close()
+
+
+def test_sqlite_products_and_total(sqlite_store):
+    """
+    Tests that products are stored and the total quantity is summed in SQL.
+    """
+    names = [product.name for product in sqlite_store.get_all_products()]
+    assert names == ["MacBook", "License", "Shipping"]
+    assert sqlite_store.get_total_quantity() == 15
+    assert sqlite_store.get_product("MacBook").get_promotion().name == "Second Half Price"
+    assert sqlite_store.get_product("Missing") is None
+
+
+def test_sqlite_order_decrements_stock(sqlite_store):
+    """
+    Tests that an order applies promotions and decrements stock in the database.
+    """
+    macbook = sqlite_store.get_product("MacBook")
+    license_product = sqlite_store.get_product("License")
+    total = sqlite_store.order([(macbook, 2), (license_product, 3)])
+    assert total == 1800
+    assert sqlite_store.get_product("MacBook").quantity == 8
+
+
+def test_sqlite_order_is_atomic(sqlite_store):
+    """
+    Tests that an order with insufficient stock is rolled back completely.
+    """
+    macbook = sqlite_store.get_product("MacBook")
+    shipping = sqlite_store.get_product("Shipping")
+    with pytest.raises(ValueError):
+        sqlite_store.order([(shipping, 1), (macbook, 11)])
+    assert sqlite_store.get_total_quantity() == 15
+
+
+def test_sqlite_stock_shared_between_connections(tmp_path):
+    """
+    Tests that a second backend on the same file sees stock changes
+    and cannot oversell.
+    """
+    path = str(tmp_path / "shared.db")
+    first = SQLiteStorage(path)
+    first.add_product(Product("iPhone", 999, 1))
+    second = SQLiteStorage(path)
+    stale = second.get_product("iPhone")
+    first.order([(first.get_product("iPhone"), 1)])
+    with pytest.raises(ValueError):
+        second.order([(stale, 1)])
+    assert second.get_product("iPhone").is_active() is False
+    first.close()
+    second.close()
+
+
+def test_sqlite_promotions_shared_between_connections(tmp_path):
+    """
+    Tests that two backends on the same file price the same order equally,
+    since promotions are stored in the database.
+    """
+    path = str(tmp_path / "shared.db")
+    first = SQLiteStorage(path)
+    mac = Product("Mac", 1000, 10)
+    mac.set_promotion(SecondHalfPrice("Second Half Price"))
+    first.add_product(mac)
+    license_product = NonStockedProduct("License", 100)
+    license_product.set_promotion(PercentDiscount("30% off", percent=30))
+    first.add_product(license_product)
+    second = SQLiteStorage(path)
+    assert first.order([(first.get_product("Mac"), 2)]) == 1500
+    assert second.order([(second.get_product("Mac"), 2)]) == 1500
+    assert second.order([(second.get_product("License"), 2)]) == 140
+    first.close()
+    second.close()
+
+
+def test_sqlite_rejects_unknown_promotion(tmp_path):
+    """
+    Tests that a product with a promotion type that cannot be stored is rejected.
+    """
+    class CustomPromotion(Promotion):
+        def apply_promotion(self, product, quantity):
+            return 0
+
+    backend = SQLiteStorage(str(tmp_path / "store.db"))
+    product = Product("Mac", 1000, 10)
+    product.set_promotion(CustomPromotion("Free"))
+    with pytest.raises(ValueError):
+        backend.add_product(product)
+    assert backend.get_product("Mac") is None
+    backend.close()
+
+
+def test_sqlite_update_product(sqlite_store):
+    """
+    Tests that changes to a product snapshot are stored by update_product.
+    """
+    macbook = sqlite_store.get_product("MacBook")
+    macbook.deactivate()
+    macbook.price = 900
+    macbook.set_promotion(PercentDiscount("10% off", percent=10))
+    sqlite_store.update_product(macbook)
+    stored = sqlite_store.get_product("MacBook")
+    assert stored.is_active() is False
+    assert stored.price == 900
+    assert stored.get_promotion().percent == 10
+    assert stored.quantity == 10
+    with pytest.raises(ValueError):
+        sqlite_store.update_product(Product("Missing", 1, 1))
+
+
+def test_sqlite_reopen_with_same_catalog(tmp_path):
+    """
+    Tests that reopening a database with the same catalog keeps the stored stock.
+    """
+    path = str(tmp_path / "store.db")
+    first = SQLiteStorage(path)
+    store = Store([Product("Mac", 1000, 10)], backend=first)
+    store.order([(store.get_product("Mac"), 3)])
+    second = SQLiteStorage(path)
+    reopened = Store([Product("Mac", 1000, 10)], backend=second)
+    assert reopened.get_total_quantity() == 7
+    first.close()
+    second.close()
+
+
+def test_sqlite_order_uses_stored_price(tmp_path):
+    """
+    Tests that an order is priced from the stored row, so a price change
+    made by another backend applies to an older product copy too.
+    """
+    path = str(tmp_path / "shared.db")
+    first = SQLiteStorage(path)
+    first.add_product(Product("Mac", 1000, 10))
+    second = SQLiteStorage(path)
+    stale = second.get_product("Mac")
+    changed = first.get_product("Mac")
+    changed.price = 2000
+    first.update_product(changed)
+    assert second.order([(stale, 1)]) == 2000
+    first.close()
+    second.close()
+
+
+def test_sqlite_order_checks_non_stocked_products(sqlite_store):
+    """
+    Tests that non-stocked products are checked against the database:
+    unknown or deactivated ones cannot be ordered.
+    """
+    with pytest.raises(ValueError):
+        sqlite_store.order([(NonStockedProduct("GhostLic", 50), 2)])
+    license_product = sqlite_store.get_product("License")
+    stale = sqlite_store.get_product("License")
+    license_product.deactivate()
+    sqlite_store.update_product(license_product)
+    with pytest.raises(ValueError):
+        sqlite_store.order([(stale, 1)])
+
+
+def test_sqlite_order_refreshes_product_stock(tmp_path):
+    """
+    Tests that after an order the given product copy shows the stored stock,
+    including orders made by another backend in between.
+    """
+    path = str(tmp_path / "shared.db")
+    first = SQLiteStorage(path)
+    first.add_product(Product("Mac", 1000, 10))
+    second = SQLiteStorage(path)
+    mac = first.get_product("Mac")
+    second.order([(second.get_product("Mac"), 3)])
+    first.order([(mac, 2)])
+    assert mac.quantity == 5
+    first.close()
+    second.close()
+
+
+def test_sqlite_iter_products_and_close(sqlite_store):
+    """
+    Tests that products can be iterated and that a closed backend raises
+    instead of blocking.
+    """
+    assert [product.name for product in sqlite_store.iter_products()] == ["MacBook", "License", "Shipping"]
+    sqlite_store.backend.close()
+    with pytest.raises(ValueError):
+        sqlite_store.get_total_quantity()
+
+
+def test_store_seed_does_not_hide_errors(tmp_path):
+    """
+    Tests that seeding a Store skips stored names but still raises for
+    new products that cannot be stored.
+    """
+    class CustomPromotion(Promotion):
+        def apply_promotion(self, product, quantity):
+            return 0
+
+    backend = SQLiteStorage(str(tmp_path / "store.db"))
+    Store([Product("Mac", 1000, 10)], backend=backend)
+    reseeded = Product("Mac", 5, 99)
+    reseeded.set_promotion(CustomPromotion("Free"))
+    Store([reseeded], backend=backend)
+    assert backend.get_product("Mac").price == 1000
+    phone = Product("Phone", 500, 5)
+    phone.set_promotion(CustomPromotion("Free"))
+    with pytest.raises(ValueError):
+        Store([phone], backend=backend)
+    backend.close()
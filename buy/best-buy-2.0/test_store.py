@@ -48,3 +48,17 @@ def test_order_raises_exception_on_insufficient_stock():
     store = Store([p1])
     with pytest.raises(ValueError):
         store.order([(p1, 5)])
+
+
+def test_update_product():
+    """
+    Tests that updating a product in the in-memory store keeps the change
+    and that updating a product not in the store raises an exception.
+    """
+    p1 = Product("iPhone", 1000, 10)
+    store = Store([p1])
+    p1.deactivate()
+    store.update_product(p1)
+    assert store.get_all_products()[0].is_active() is False
+    with pytest.raises(ValueError):
+        store.update_product(Product("MacBook", 2000, 5))